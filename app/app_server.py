@@ -151,9 +151,10 @@ def stop():
 # -----------------image generations----------
 
 from fastapi import FastAPI, Response
-from pydantic import BaseModel
-from typing import List, Tuple
+from pydantic import BaseModel, validator
+from typing import List, Tuple, Union
 from PIL import Image, ImageDraw, ImageFont
+import heapq
 import io
 import math
 import random
@@ -209,7 +210,48 @@ def check_collision(x, y, w, h, angle, placed_boxes, margin=15):
 class ScoreItem(BaseModel):
     name: str
     score: int
-    
+
+
+class ScoreColumns(BaseModel):
+    """Columnar request body: names[i] scored scores[i]."""
+    names: List[str]
+    scores: List[int]
+
+    @validator("scores")
+    def same_length(cls, v, values):
+        if "names" in values and len(v) != len(values["names"]):
+            raise ValueError("names and scores must have the same length")
+        return v
+
+
+def estimate_label_capacity(avg_name_len, size=1600, font_size=18, margin=12, padding=20):
+    """Upper bound on how many labels the canvas can hold.
+
+    Uses the smallest font and ignores rotation, so the estimate errs on
+    the high side rather than cutting names that would have fit.
+    """
+    try:
+        font = ImageFont.truetype("arial.ttf", font_size)
+    except:
+        font = ImageFont.load_default()
+
+    draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    w, h = text_size(draw, "x" * max(1, round(avg_name_len)), font)
+
+    usable = (size - 2 * padding) ** 2
+    footprint = (w + margin) * (h + margin)
+    return max(1, int(usable // footprint))
+
+
+def select_top_scores(names, scores, k):
+    """Heap-select the k highest scores.
+
+    Returns (top items sorted by score desc, rank cutoff, dropped count).
+    """
+    idx = heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+    top = [ScoreItem.construct(name=names[i], score=scores[i]) for i in idx]
+    return top, len(top), len(scores) - len(top)
+
 def generate_circular_leaderboard(scores):
     # Sort by score descending
     scores = sorted(scores, key=lambda x: x.score, reverse=True)
@@ -387,6 +429,27 @@ def generate_circular_leaderboard(scores):
 
 
 @app.post("/leaderboard")
-def leaderboard(scores: List[ScoreItem]):
-    img = generate_circular_leaderboard(scores)
-    return Response(content=img.getvalue(), media_type="image/png")
\ No newline at end of file
+def leaderboard(scores: Union[ScoreColumns, List[ScoreItem]], fit: bool = False):
+    if isinstance(scores, ScoreColumns):
+        names, values = scores.names, scores.scores
+    else:
+        names = [s.name for s in scores]
+        values = [s.score for s in scores]
+
+    if not fit:
+        items = [ScoreItem.construct(name=n, score=v) for n, v in zip(names, values)]
+        img = generate_circular_leaderboard(items)
+        return Response(content=img.getvalue(), media_type="image/png")
+
+    # Capacity-aware mode: only rank as many entries as the canvas can hold
+    # (+1 for the centre name) instead of sorting and placing all of them.
+    avg_len = sum(map(len, names)) / len(names) if names else 0
+    k = estimate_label_capacity(avg_len) + 1
+    items, cutoff, dropped = select_top_scores(names, values, k)
+
+    img = generate_circular_leaderboard(items)
+    return Response(
+        content=img.getvalue(),
+        media_type="image/png",
+        headers={"X-Rank-Cutoff": str(cutoff), "X-Dropped-Count": str(dropped)},
+    )